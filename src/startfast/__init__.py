@@ -10,8 +10,9 @@ __version__ = "0.1.0"
 __author__ = "StartFast Team"
 __email__ = "ab.adelodun@gmail.com"
 
+from typing import Any
+
 from .core.config import ProjectConfig, ProjectType, DatabaseType, AuthType
-from .generators.project_generator import ProjectGenerator
 
 __all__ = [
     "ProjectConfig",
@@ -20,3 +21,12 @@ __all__ = [
     "AuthType",
     "ProjectGenerator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Generators load on first use so the CLI can answer --help without them
+    if name == "ProjectGenerator":
+        from .generators.project_generator import ProjectGenerator
+
+        return ProjectGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,49 +5,80 @@ The Django-admin startproject for FastAPI developers who value their time
 
 import argparse
 import os
+import re
 import sys
-import time
-from typing import Optional, Dict, Any, List
-from pathlib import Path
-
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, Confirm, IntPrompt
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.text import Text
-from rich.align import Align
-from rich.columns import Columns
-from rich.live import Live
-from rich import box
-from rich.padding import Padding
-from rich.rule import Rule
-from rich.theme import Theme
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
 
 from .core.config import ProjectConfig, ProjectType, DatabaseType, AuthType
-from .generators.project_generator import ProjectGenerator
-
-# Console with developer-friendly theme
-from rich.theme import Theme
-
-console = Console(
-    theme=Theme({
-        "primary": "bright_cyan",
-        "success": "bright_green", 
-        "warning": "yellow",
-        "error": "red",
-        "muted": "dim white",
-        "accent": "magenta"
-    }),
-    highlight=False  # Don't auto-highlight, we'll be intentional
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# CLI names for each database and auth option, shared by every flow
+_DB_CHOICES = {
+    "postgres": DatabaseType.POSTGRESQL,
+    "mysql": DatabaseType.MYSQL,
+    "sqlite": DatabaseType.SQLITE,
+    "mongo": DatabaseType.MONGODB,
+}
+_AUTH_CHOICES = {
+    "jwt": AuthType.JWT,
+    "oauth2": AuthType.OAUTH2,
+    "api-key": AuthType.API_KEY,
+    "none": AuthType.NONE,
+}
+_DB_NAMES = tuple(_DB_CHOICES)
+_AUTH_NAMES = tuple(_AUTH_CHOICES)
+
+# Quick-start option lists as (CLI name, label, description), recommended first
+_DB_OPTIONS = (
+    ("postgres", "PostgreSQL", "Production-ready, full features"),
+    ("sqlite", "SQLite", "Development, zero setup"),
+    ("mysql", "MySQL", "High performance, wide compatibility"),
+    ("mongo", "MongoDB", "Document store, flexible schema"),
+)
+_AUTH_OPTIONS = (
+    ("jwt", "JWT tokens", "Standard, stateless auth"),
+    ("oauth2", "OAuth2 + scopes", "Enterprise, fine-grained permissions"),
+    ("api-key", "API keys", "Simple, service-to-service"),
+    ("none", "No auth", "Open API, internal use"),
 )
 
+# Marker file -> kind of project it indicates, checked in order
+_PROJECT_MARKERS = (
+    ("main.py", "FastAPI project"),
+    ("manage.py", "Django project"),
+    ("app.py", "Flask project"),
+    ("package.json", "Node.js project"),
+)
+
+# Letters, numbers, hyphens and underscores, with at least one letter or number
+_PROJECT_NAME_RE = re.compile(r"\A[-_]*[^\W_][\w-]*\Z")
+
+# Console theme, the console itself is created on first output
+_CONSOLE_THEME = {
+    "primary": "bright_cyan",
+    "success": "bright_green",
+    "warning": "yellow",
+    "error": "red",
+    "muted": "dim white",
+    "accent": "magenta",
+}
+
+
 class StartFastCLI:
     """Professional FastAPI project generator for developers"""
     
-    def __init__(self):
-        self.console = console
-        
+    @cached_property
+    def console(self) -> "Console":
+        """Themed console, Rich is imported here so --help never loads it"""
+        from rich.console import Console
+        from rich.theme import Theme
+
+        # Don't auto-highlight, we'll be intentional
+        return Console(theme=Theme(_CONSOLE_THEME), highlight=False)
+
     def create_argument_parser(self) -> argparse.ArgumentParser:
         """Argument parser optimized for developer workflow"""
         parser = argparse.ArgumentParser(
@@ -67,12 +98,12 @@ Examples:
         
         # Core stack choices (the ones that actually matter)
         parser.add_argument("--db", "--database", 
-                          choices=["postgres", "mysql", "sqlite", "mongo"], 
+                          choices=_DB_NAMES,
                           default="postgres",
                           help="Database (default: postgres)")
         
         parser.add_argument("--auth", 
-                          choices=["jwt", "oauth2", "api-key", "none"],
+                          choices=_AUTH_NAMES,
                           default="jwt", 
                           help="Auth method (default: jwt)")
         
@@ -89,48 +120,60 @@ Examples:
         parser.add_argument("-q", "--quiet", action="store_true", help="Minimal output")
         parser.add_argument("--interactive", action="store_true", help="Interactive customization")
         parser.add_argument("--dry-run", action="store_true", help="Show what would be created")
+        parser.add_argument("--no-parallel-io", dest="parallel_io",
+                          action="store_false",
+                          help="Write generated files one at a time")
         
         return parser
 
     def show_banner(self):
         """Clean, confident banner"""
+        # Piped or captured output gets no decoration, skip building it
+        if not self.console.is_terminal:
+            return
+
+        from rich.text import Text
+        from rich.align import Align
+
         title = Text("StartFast", style="bold bright_cyan")
         subtitle = Text("Professional FastAPI projects, instantly", style="muted")
         
-        console.print()
-        console.print(Align.center(title))
-        console.print(Align.center(subtitle))
-        console.print()
+        self.console.print()
+        self.console.print(Align.center(title))
+        self.console.print(Align.center(subtitle))
+        self.console.print()
 
     def detect_existing_project(self, path: str) -> Optional[str]:
         """Smart detection of existing projects"""
-        if os.path.exists(os.path.join(path, "main.py")):
-            return "FastAPI project"
-        elif os.path.exists(os.path.join(path, "manage.py")):
-            return "Django project"
-        elif os.path.exists(os.path.join(path, "app.py")):
-            return "Flask project"
-        elif os.path.exists(os.path.join(path, "package.json")):
-            return "Node.js project"
+        # One directory listing instead of a stat per marker file
+        try:
+            entries = set(os.listdir(path))
+        except OSError:
+            return None
+        for marker, project_kind in _PROJECT_MARKERS:
+            if marker in entries:
+                return project_kind
         return None
 
     def quick_start_flow(self, name: str, path: str = ".") -> ProjectConfig:
         """Fast path: smart defaults with escape hatch"""
+        from rich.prompt import Confirm
+
         project_path = os.path.join(path, name)
         
         # Check for existing project
         existing = self.detect_existing_project(project_path)
         if existing:
-            console.print(f"[warning]Found {existing} in {project_path}[/]")
+            self.console.print(f"[warning]Found {existing} in {project_path}[/]")
             if not Confirm.ask("Replace it?", default=False):
-                console.print("[muted]Cancelled[/]")
+                self.console.print("[muted]Cancelled[/]")
                 sys.exit(0)
         
-        console.print(f"[primary]Creating {name}[/] with production defaults...")
-        console.print("[muted]PostgreSQL • JWT Auth • Docker • Tests • Async[/]")
+        self.console.print(f"[primary]Creating {name}[/] with production defaults...")
+        self.console.print("[muted]PostgreSQL • JWT Auth • Docker • Tests • Async[/]")
         
         # Quick customization offer
-        console.print()
+        self.console.print()
         customize = Confirm.ask("[muted]Customize database or auth?[/]", default=False)
         
         if customize:
@@ -153,45 +196,14 @@ Examples:
 
     def minimal_customization(self, name: str, project_path: str) -> ProjectConfig:
         """Essential choices only"""
-        console.print()
+        self.console.print()
         
         # Database choice (the one that actually impacts development)
-        db_options = [
-            ("postgres", "PostgreSQL", "Production-ready, full features"),
-            ("sqlite", "SQLite", "Development, zero setup"),
-            ("mysql", "MySQL", "High performance, wide compatibility"),
-            ("mongo", "MongoDB", "Document store, flexible schema")
-        ]
-        
-        console.print("[primary]Database:[/]")
-        for i, (key, name_db, desc) in enumerate(db_options, 1):
-            marker = "•" if key != "postgres" else "• [success](recommended)[/]"
-            console.print(f"  {i}. {marker} [bright_white]{name_db}[/] [muted]- {desc}[/]")
-        
-        db_choice = IntPrompt.ask("", default=1, choices=["1", "2", "3", "4"])
-        db_key = db_options[db_choice - 1][0]
-        db_mapping = {"postgres": DatabaseType.POSTGRESQL, "sqlite": DatabaseType.SQLITE,
-                     "mysql": DatabaseType.MYSQL, "mongo": DatabaseType.MONGODB}
-        database_type = db_mapping[db_key]
-        
+        database_type = _DB_CHOICES[self._ask_option("Database:", _DB_OPTIONS)]
+
         # Auth choice (the other critical decision)
-        auth_options = [
-            ("jwt", "JWT tokens", "Standard, stateless auth"),
-            ("oauth2", "OAuth2 + scopes", "Enterprise, fine-grained permissions"),
-            ("api-key", "API keys", "Simple, service-to-service"),
-            ("none", "No auth", "Open API, internal use")
-        ]
-        
-        console.print("\n[primary]Authentication:[/]")
-        for i, (key, name_auth, desc) in enumerate(auth_options, 1):
-            marker = "•" if key != "jwt" else "• [success](recommended)[/]"
-            console.print(f"  {i}. {marker} [bright_white]{name_auth}[/] [muted]- {desc}[/]")
-        
-        auth_choice = IntPrompt.ask("", default=1, choices=["1", "2", "3", "4"])
-        auth_key = auth_options[auth_choice - 1][0]
-        auth_mapping = {"jwt": AuthType.JWT, "oauth2": AuthType.OAUTH2,
-                       "api-key": AuthType.API_KEY, "none": AuthType.NONE}
-        auth_type = auth_mapping[auth_key]
+        self.console.print()
+        auth_type = _AUTH_CHOICES[self._ask_option("Authentication:", _AUTH_OPTIONS)]
         
         return ProjectConfig(
             name=name,
@@ -207,52 +219,62 @@ Examples:
             python_version="3.11"
         )
 
+    def _ask_option(self, title: str, options: Sequence[Tuple[str, str, str]]) -> str:
+        """Show a numbered option list, the first entry recommended, return the key"""
+        from rich.prompt import IntPrompt
+
+        self.console.print(f"[primary]{title}[/]")
+        for i, (key, label, desc) in enumerate(options, 1):
+            marker = "• [success](recommended)[/]" if i == 1 else "•"
+            self.console.print(f"  {i}. {marker} [bright_white]{label}[/] [muted]- {desc}[/]")
+
+        choices = [str(i) for i in range(1, len(options) + 1)]
+        choice = IntPrompt.ask("", default=1, choices=choices)
+        return options[choice - 1][0]
+
     def power_user_flow(self) -> ProjectConfig:
         """Full customization for when you need it"""
+        from rich.prompt import Prompt, Confirm, IntPrompt
+
         self.show_banner()
-        console.print("[primary]Full customization mode[/]")
-        console.print()
+        self.console.print("[primary]Full customization mode[/]")
+        self.console.print()
         
         # Project name and path
         name = Prompt.ask("[primary]Project name[/]")
-        while not name or not name.replace('-', '').replace('_', '').isalnum():
-            console.print("[error]Invalid name. Use letters, numbers, hyphens, underscores.[/]")
+        while not _PROJECT_NAME_RE.match(name or ""):
+            self.console.print("[error]Invalid name. Use letters, numbers, hyphens, underscores.[/]")
             name = Prompt.ask("[primary]Project name[/]")
         
         path = Prompt.ask("[primary]Create in[/]", default=".")
         project_path = os.path.join(path, name)
         
         # Project type (business logic matters here)
-        console.print("\n[primary]What are you building?[/]")
+        self.console.print("\n[primary]What are you building?[/]")
         type_options = [
             (ProjectType.API, "Simple API", "Basic endpoints, CRUD operations"),
             (ProjectType.CRUD, "Full backend", "User management, complex data models, production-ready")
         ]
         
         for i, (ptype, name_type, desc) in enumerate(type_options, 1):
-            console.print(f"  {i}. [bright_white]{name_type}[/] [muted]- {desc}[/]")
+            self.console.print(f"  {i}. [bright_white]{name_type}[/] [muted]- {desc}[/]")
         
-        type_choice = IntPrompt.ask("", default=2, choices=["1", "2", "3"])
+        type_choices = [str(i) for i in range(1, len(type_options) + 1)]
+        type_choice = IntPrompt.ask("", default=2, choices=type_choices)
         project_type = type_options[type_choice - 1][0]
         
         # Database
-        db_mapping = {"postgres": DatabaseType.POSTGRESQL, "mysql": DatabaseType.MYSQL, 
-                     "sqlite": DatabaseType.SQLITE, "mongo": DatabaseType.MONGODB}
-        
-        console.print(f"\n[primary]Database[/] [muted](current: PostgreSQL)[/]")
+        self.console.print(f"\n[primary]Database[/] [muted](current: PostgreSQL)[/]")
         db_input = Prompt.ask("postgres/mysql/sqlite/mongo", default="postgres")
-        database_type = db_mapping.get(db_input.lower(), DatabaseType.POSTGRESQL)
+        database_type = _DB_CHOICES.get(db_input.lower(), DatabaseType.POSTGRESQL)
         
         # Auth
-        auth_mapping = {"jwt": AuthType.JWT, "oauth2": AuthType.OAUTH2,
-                       "api-key": AuthType.API_KEY, "none": AuthType.NONE}
-        
-        console.print(f"\n[primary]Auth method[/] [muted](current: JWT)[/]")
+        self.console.print(f"\n[primary]Auth method[/] [muted](current: JWT)[/]")
         auth_input = Prompt.ask("jwt/oauth2/api-key/none", default="jwt")
-        auth_type = auth_mapping.get(auth_input.lower(), AuthType.JWT)
+        auth_type = _AUTH_CHOICES.get(auth_input.lower(), AuthType.JWT)
         
         # Advanced features
-        console.print(f"\n[primary]Additional features[/] [muted](optional)[/]")
+        self.console.print(f"\n[primary]Additional features[/] [muted](optional)[/]")
         include_celery = Confirm.ask("Background tasks (Celery)", default=False)
         include_monitoring = Confirm.ask("Monitoring (Prometheus, health checks)", default=False)
         
@@ -272,28 +294,24 @@ Examples:
 
     def create_config_from_args(self, args) -> ProjectConfig:
         """Convert CLI args to config"""
+        from rich.prompt import Confirm
+
         if not args.name:
-            console.print("[error]Project name required[/]")
-            console.print("[muted]Try: startfast my-api[/]")
+            self.console.print("[error]Project name required[/]")
+            self.console.print("[muted]Try: startfast my-api[/]")
             sys.exit(1)
             
         project_path = os.path.join(args.path, args.name)
         
         # Handle existing directory
-        if os.path.exists(project_path) and not args.force:
+        if not args.force and os.path.exists(project_path):
             existing = self.detect_existing_project(project_path)
             if existing:
-                console.print(f"[warning]Found {existing} in {project_path}[/]")
+                self.console.print(f"[warning]Found {existing} in {project_path}[/]")
             if not Confirm.ask("Replace it?", default=False):
-                console.print("[muted]Cancelled[/]")
+                self.console.print("[muted]Cancelled[/]")
                 sys.exit(0)
         
-        # Map CLI args to enums
-        db_mapping = {"postgres": DatabaseType.POSTGRESQL, "mysql": DatabaseType.MYSQL,
-                     "sqlite": DatabaseType.SQLITE, "mongo": DatabaseType.MONGODB}
-        auth_mapping = {"jwt": AuthType.JWT, "oauth2": AuthType.OAUTH2, 
-                       "api-key": AuthType.API_KEY, "none": AuthType.NONE}
-        
         if args.minimal:
             project_type = ProjectType.API
         else:
@@ -303,20 +321,24 @@ Examples:
             name=args.name,
             path=project_path,
             project_type=project_type,
-            database_type=db_mapping[args.db],
-            auth_type=auth_mapping[args.auth],
+            # Map CLI args to enums
+            database_type=_DB_CHOICES[args.db],
+            auth_type=_AUTH_CHOICES[args.auth],
             include_docker=not args.minimal,
             include_tests=not args.minimal,
             include_docs=not args.minimal,
             include_monitoring=args.monitoring,
             include_celery=args.celery,
-            python_version=args.python
+            python_version=args.python,
+            parallel_io=args.parallel_io
         )
 
     def show_config_preview(self, config: ProjectConfig, dry_run: bool = False):
         """Clean, scannable config summary"""
+        from rich.prompt import Confirm
+
         action = "Would create" if dry_run else "Creating"
-        console.print(f"\n[success]{action}[/] [bright_white]{config.name}[/]")
+        self.console.print(f"\n[success]{action}[/] [bright_white]{config.name}[/]")
         
         # Essential info only
         details = [
@@ -330,77 +352,90 @@ Examples:
         if config.include_monitoring:
             details.append("Monitoring: Yes")
             
-        console.print("[muted]" + " • ".join(details) + "[/]")
+        self.console.print("[muted]" + " • ".join(details) + "[/]")
         
         if not dry_run and not Confirm.ask("\nProceed?", default=True):
-            console.print("[muted]Cancelled[/]")
+            self.console.print("[muted]Cancelled[/]")
             sys.exit(0)
 
-    def generate_with_progress(self, config: ProjectConfig):
+    def generate_with_progress(self, config: ProjectConfig, quiet: bool = False):
         """Efficient progress display"""
-        with console.status("[primary]Generating project...[/]", spinner="dots") as status:
-            # Actual generation
-            generator = ProjectGenerator(config)
+        from .generators.project_generator import ProjectGenerator
+
+        generator = ProjectGenerator(config)
+        if quiet:
+            # No spinner to animate for scripted runs
+            generator.generate()
+            return
+
+        with self.console.status("[primary]Generating project...[/]", spinner="dots"):
             generator.generate()
-            time.sleep(0.5)  # Brief pause for perception of completion
 
     def show_completion(self, config: ProjectConfig, quiet: bool = False):
         """Success message optimized for next action"""
         if quiet:
-            console.print(f"[success]✓[/] {config.name}")
+            self.console.print(f"[success]✓[/] {config.name}")
             return
             
-        console.print(f"\n[success]✓[/] [bright_white]{config.name}[/] ready")
-        
-        # Immediate next steps (what they actually need)
-        console.print(f"\n[primary]cd {config.name}[/]")
-        console.print("[primary]pip install -r requirements.txt[/]") 
-        console.print("[primary]uvicorn app.main:app --reload[/]")
-        
-        # Useful endpoints
-        console.print(f"\n[muted]API docs: http://localhost:8000/docs[/]")
+        lines = [
+            f"\n[success]✓[/] [bright_white]{config.name}[/] ready",
+            # Immediate next steps (what they actually need)
+            f"\n[primary]cd {config.name}[/]",
+            "[primary]pip install -r requirements.txt[/]",
+            "[primary]uvicorn app.main:app --reload[/]",
+            # Useful endpoints
+            "\n[muted]API docs: http://localhost:8000/docs[/]",
+        ]
         if config.auth_type != AuthType.NONE:
-            console.print(f"[muted]Auth: POST /auth/login[/]")
+            lines.append("[muted]Auth: POST /auth/login[/]")
+
+        # One render and one terminal write for the whole block
+        self.console.print("\n".join(lines))
 
     def main(self):
         """Main entry point with intelligent flow detection"""
+        # argparse exits on --help or bad flags before any Rich import happens
+        args = self.create_argument_parser().parse_args()
+
         try:
-            parser = self.create_argument_parser()
-            args = parser.parse_args()
-            
-            # Flow routing based on user intent
-            if args.interactive:
-                # Power user wants full control
-                config = self.power_user_flow()
-            elif args.name:
-                # CLI user with specific requirements  
-                config = self.create_config_from_args(args)
-            else:
-                # Interactive quick start (most common)
-                self.show_banner()
-                name = Prompt.ask("[primary]Project name[/]")
-                config = self.quick_start_flow(name, args.path)
-            
-            # Show what we're about to do
-            if not args.quiet:
-                self.show_config_preview(config, args.dry_run)
-            
-            if args.dry_run:
-                return
-                
-            # Generate the project
-            self.generate_with_progress(config)
-            
-            # Show completion with next steps
-            self.show_completion(config, args.quiet)
-            
+            self.run(args)
         except KeyboardInterrupt:
-            console.print("\n[muted]Cancelled[/]")
+            self.console.print("\n[muted]Cancelled[/]")
             sys.exit(1)
         except Exception as e:
-            console.print(f"\n[error]Error: {e}[/]")
+            self.console.print(f"\n[error]Error: {e}[/]")
             sys.exit(1)
 
+    def run(self, args: argparse.Namespace):
+        """Build the config for the parsed arguments and generate the project"""
+        # Flow routing based on user intent
+        if args.interactive:
+            # Power user wants full control
+            config = self.power_user_flow()
+        elif args.name:
+            # CLI user with specific requirements
+            config = self.create_config_from_args(args)
+        else:
+            # Interactive quick start (most common)
+            from rich.prompt import Prompt
+
+            self.show_banner()
+            name = Prompt.ask("[primary]Project name[/]")
+            config = self.quick_start_flow(name, args.path)
+
+        # Show what we're about to do
+        if not args.quiet:
+            self.show_config_preview(config, args.dry_run)
+
+        if args.dry_run:
+            return
+
+        # Generate the project
+        self.generate_with_progress(config, args.quiet)
+
+        # Show completion with next steps
+        self.show_completion(config, args.quiet)
+
 
 def main():
     """Entry point"""
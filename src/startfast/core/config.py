@@ -2,13 +2,10 @@
 Configuration classes and enums for StartFast project generator
 """
 
-import logging
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
-
-# Configure logging
-logger = logging.getLogger(__name__)
+from functools import cached_property
+from typing import Any, Optional
 
 
 class ProjectType(Enum):
@@ -36,6 +33,21 @@ class AuthType(Enum):
     API_KEY = "api-key"
 
 
+# Database types served through SQLAlchemy
+SQL_DATABASE_TYPES = frozenset(
+    {DatabaseType.SQLITE, DatabaseType.POSTGRESQL, DatabaseType.MYSQL}
+)
+
+# Auth types backed by user accounts and tokens
+TOKEN_AUTH_TYPES = frozenset({AuthType.JWT, AuthType.OAUTH2})
+
+# Cached ProjectConfig properties derived from each field, dropped on reassignment
+_CACHED_BY_FIELD = {
+    "name": ("name_snake", "name_pascal"),
+    "database_type": ("uses_sqlalchemy",),
+}
+
+
 @dataclass
 class ProjectConfig:
     """Configuration for project generation"""
@@ -51,6 +63,8 @@ class ProjectConfig:
     include_monitoring: bool = False
     include_celery: bool = False
     python_version: str = "3.11"
+    # Write batches of files from a thread pool, disable for filesystems that misbehave
+    parallel_io: bool = True
 
     def __post_init__(self):
         """Validate configuration after initialization"""
@@ -67,3 +81,28 @@ class ProjectConfig:
             self.database_type = DatabaseType(self.database_type)
         if isinstance(self.auth_type, str):
             self.auth_type = AuthType(self.auth_type)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Recompute derived values on next access when their source field changes
+        for cached in _CACHED_BY_FIELD.get(name, ()):
+            self.__dict__.pop(cached, None)
+
+    # Derived values are computed once, until the field they come from is reassigned
+
+    @cached_property
+    def name_snake(self) -> str:
+        """Project name in snake_case, e.g. my-api -> my_api"""
+        return self.name.lower().replace("-", "_")
+
+    @cached_property
+    def uses_sqlalchemy(self) -> bool:
+        """Whether the database is one of the SQLAlchemy-backed SQL databases"""
+        return self.database_type in SQL_DATABASE_TYPES
+
+    @cached_property
+    def name_pascal(self) -> str:
+        """Project name in PascalCase, e.g. my-api -> MyApi"""
+        return "".join(
+            word.capitalize() for word in self.name.replace("-", "_").split("_")
+        )
@@ -4,21 +4,105 @@ Provides common functionality for all generators
 """
 
 import os
+import string
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from pathlib import Path
 
-from ..core.config import ProjectConfig
+from ..core.config import AuthType, DatabaseType, ProjectConfig
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Batches at least this large are written from a small thread pool
+_PARALLEL_WRITE_MIN_FILES = 2
+_MAX_WRITE_WORKERS = 4
+
+
+class CompiledTemplate:
+    """A str.format-style template parsed once into literal chunks and fields
+
+    Rendering fills the field slots and joins the chunks, so the template
+    text and its {{ }} escapes are only scanned when the template is built.
+    """
+
+    __slots__ = ("_parts", "_slots", "_static", "_encoded_parts")
+
+    def __init__(self, template: str):
+        parts: List[str] = []
+        slots: List[Tuple[int, str]] = []
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(
+            template
+        ):
+            if literal:
+                parts.append(literal)
+            if field_name is None:
+                continue
+            if format_spec or conversion or not field_name.isidentifier():
+                raise ValueError(f"Unsupported template field: {{{field_name}}}")
+            slots.append((len(parts), field_name))
+            parts.append("")
+        self._parts = parts
+        self._slots = slots
+        # Templates without fields (only literal {{ }} braces) render to a constant
+        self._static = None if slots else "".join(parts)
+        # UTF-8 literal chunks, encoded on first byte render
+        self._encoded_parts: Optional[List[bytes]] = None
+
+    @property
+    def needs_format(self) -> bool:
+        """Whether the template has any fields to fill"""
+        return self._static is None
+
+    def render(self, **values: Any) -> str:
+        """Render the template with the given field values"""
+        return self.render_map(values)
+
+    def render_map(self, values: Mapping[str, Any]) -> str:
+        """Render the template with field values looked up in a mapping"""
+        if self._static is not None:
+            return self._static
+        parts = self._parts.copy()
+        for index, field_name in self._slots:
+            parts[index] = str(values[field_name])
+        return "".join(parts)
+
+    def render_bytes_map(self, values: Mapping[str, Any]) -> bytes:
+        """Render straight to UTF-8, encoding only the field values"""
+        if self._encoded_parts is None:
+            self._encoded_parts = [part.encode("utf-8") for part in self._parts]
+        parts = self._encoded_parts.copy()
+        for index, field_name in self._slots:
+            parts[index] = str(values[field_name]).encode("utf-8")
+        return b"".join(parts)
+
 
 class BaseGenerator(ABC):
     """Base class for all file generators"""
 
+    # Compiled templates shared by every generator, keyed by template text
+    _compiled_templates: ClassVar[Dict[str, CompiledTemplate]] = {}
+
     def __init__(self, config: ProjectConfig):
         self.config = config
+        self._template_vars: Optional[Dict[str, Any]] = None
+        # Writes queued by batched_writes(), None when writing immediately
+        self._pending_writes: Optional[List[Tuple[str, Union[str, bytes]]]] = None
+        # Directories known to exist, so repeated writes skip the mkdir call
+        self._ensured_dirs: Set[Path] = set()
 
     def should_generate(self) -> bool:
         """Determine if this generator should run based on configuration"""
@@ -29,23 +113,94 @@ class BaseGenerator(ABC):
         """Generate the files for this component"""
         pass
 
-    def write_file(self, file_path: str, content: str):
+    def write_file(self, file_path: str, content: Union[str, bytes]):
         """Write content to a file, creating directories if needed"""
+        if self._pending_writes is not None:
+            self._pending_writes.append((file_path, content))
+            return
         file_path = Path(file_path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ensure_directory(file_path.parent)
+        self._write_content(file_path, content)
+
+    def write_files(self, files: List[Tuple[str, Union[str, bytes]]]):
+        """Write several (path, content) pairs, creating each directory once"""
+        if self._pending_writes is not None:
+            self._pending_writes.extend(files)
+            return
+        # Only the last content queued for a path would survive, so write just that
+        latest = {Path(file_path): content for file_path, content in files}
+        paths = list(latest.items())
+        for directory in {file_path.parent for file_path in latest}:
+            self.ensure_directory(directory)
+        # Writes release the GIL, and every path in the batch is distinct
+        if self.config.parallel_io and len(paths) >= _PARALLEL_WRITE_MIN_FILES:
+            workers = min(_MAX_WRITE_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Consume the results so the first write error is re-raised here
+                list(executor.map(lambda item: self._write_content(*item), paths))
+            return
+        for file_path, content in paths:
+            self._write_content(file_path, content)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+    def ensure_directory(self, directory: Path):
+        """Create a directory and its parents unless already done by this generator"""
+        if directory in self._ensured_dirs:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(directory)
+        self._ensured_dirs.update(directory.parents)
+
+    def reset_directory_cache(self):
+        """Forget created directories, e.g. after the project tree was removed"""
+        self._ensured_dirs.clear()
+
+    @contextmanager
+    def batched_writes(
+        self, owner: Optional["BaseGenerator"] = None
+    ) -> Iterator[None]:
+        """Queue writes made inside the block and flush them together on exit
+
+        When ``owner`` has a batch open, writes join that batch instead and are
+        flushed when the owner's block exits.
+        """
+        if self._pending_writes is not None:
+            yield
+            return
+        if owner is not None and owner._pending_writes is not None:
+            self._pending_writes = owner._pending_writes
+            try:
+                yield
+            finally:
+                self._pending_writes = None
+            return
+        self._pending_writes = []
+        try:
+            yield
+        finally:
+            # Flush even if the block failed, matching unbatched partial output
+            pending, self._pending_writes = self._pending_writes, None
+            self.write_files(pending)
+
+    @staticmethod
+    def _write_content(file_path: Path, content: Union[str, bytes]):
+        """Write content to an existing directory with a single buffer"""
+        # Pre-encoded content is written as-is, text is encoded as UTF-8
+        data = content if isinstance(content, bytes) else content.encode("utf-8")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(file_path, flags, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
 
     def get_template_vars(self) -> Dict[str, Any]:
         """Get template variables for string formatting"""
         return {
             "project_name": self.config.name,
-            "project_name_snake": self.config.name.lower().replace("-", "_"),
-            "project_name_pascal": "".join(
-                word.capitalize()
-                for word in self.config.name.replace("-", "_").split("_")
-            ),
+            "project_name_snake": self.config.name_snake,
+            "project_name_pascal": self.config.name_pascal,
             "database_type": self.config.database_type.value,
             "auth_type": self.config.auth_type.value,
             "python_version": self.config.python_version,
@@ -56,19 +211,41 @@ class BaseGenerator(ABC):
             "include_celery": self.config.include_celery,
         }
 
-    def format_template(self, template: str) -> str:
+    @staticmethod
+    def compile_template(template: str) -> CompiledTemplate:
+        """Get the shared compiled form of a template, compiling it on first use"""
+        compiled = BaseGenerator._compiled_templates.get(template)
+        if compiled is None:
+            compiled = CompiledTemplate(template)
+            BaseGenerator._compiled_templates[template] = compiled
+        return compiled
+
+    def format_template(self, template: str, **extra_vars: Any) -> str:
         """Format a template string with project variables"""
-        return template.format(**self.get_template_vars())
+        if "{" not in template and "}" not in template:
+            return template
+        compiled = self.compile_template(template)
+        if not compiled.needs_format:
+            return compiled.render()
+        return compiled.render_map(self._get_format_values(extra_vars))
+
+    def format_template_bytes(self, template: str, **extra_vars: Any) -> bytes:
+        """Format a template straight to UTF-8 bytes ready for writing"""
+        compiled = self.compile_template(template)
+        return compiled.render_bytes_map(self._get_format_values(extra_vars))
+
+    def _get_format_values(self, extra_vars: Dict[str, Any]) -> Mapping[str, Any]:
+        """Get project variables merged with any per-template values"""
+        # Project variables are fixed once generation starts, so build them once
+        if self._template_vars is None:
+            self._template_vars = self.get_template_vars()
+        if extra_vars:
+            return {**self._template_vars, **extra_vars}
+        return self._template_vars
 
     def get_database_imports(self) -> dict:
         """Get database-specific imports based on configuration"""
-        from ..core.config import DatabaseType
-
-        if self.config.database_type in [
-            DatabaseType.SQLITE,
-            DatabaseType.POSTGRESQL,
-            DatabaseType.MYSQL,
-        ]:
+        if self.config.uses_sqlalchemy:
             return {
                 "session_import": "from sqlalchemy.ext.asyncio import AsyncSession",
                 "session_type": "AsyncSession",
@@ -104,13 +281,7 @@ class BaseGenerator(ABC):
 
     def get_model_base_class(self) -> str:
         """Get the appropriate base class for models"""
-        from ..core.config import DatabaseType
-
-        if self.config.database_type in [
-            DatabaseType.SQLITE,
-            DatabaseType.POSTGRESQL,
-            DatabaseType.MYSQL,
-        ]:
+        if self.config.uses_sqlalchemy:
             return "BaseModel"
         elif self.config.database_type == DatabaseType.MONGODB:
             return "Document"
@@ -119,18 +290,10 @@ class BaseGenerator(ABC):
 
     def should_generate_sqlalchemy_files(self) -> bool:
         """Check if SQLAlchemy files should be generated"""
-        from ..core.config import DatabaseType
-
-        return self.config.database_type in [
-            DatabaseType.SQLITE,
-            DatabaseType.POSTGRESQL,
-            DatabaseType.MYSQL,
-        ]
+        return self.config.uses_sqlalchemy
 
     def should_generate_auth_models(self) -> bool:
         """Check if auth models should be generated (requires SQL database)"""
-        from ..core.config import AuthType
-
         return (
             self.config.auth_type != AuthType.NONE
             and self.should_generate_sqlalchemy_files()
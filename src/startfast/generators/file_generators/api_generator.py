@@ -4,30 +4,31 @@ Generates API endpoints and routers
 """
 
 from ...generators.base_generator import BaseGenerator
-from ...core.config import ProjectType, AuthType
+from ...core.config import AuthType, ProjectConfig
 
 
 class APIGenerator(BaseGenerator):
     """Generates API endpoints"""
 
+    def __init__(self, config: ProjectConfig):
+        super().__init__(config)
+        # Every API file lives under app/api/v1, build the prefix once
+        self._api_v1_dir = f"{config.path}/app/api/v1"
+
     def generate(self):
         """Generate API files"""
         # Generate main endpoints
         endpoints_content = self._get_endpoints_template()
-        self.write_file(
-            f"{self.config.path}/app/api/v1/endpoints.py", endpoints_content
-        )
+        self.write_file(self._api_v1_dir + "/endpoints.py", endpoints_content)
 
         # Generate auth endpoints if authentication is enabled
         if self.config.auth_type != AuthType.NONE:
             auth_endpoints_content = self._get_auth_endpoints_template()
-            self.write_file(
-                f"{self.config.path}/app/api/v1/auth.py", auth_endpoints_content
-            )
+            self.write_file(self._api_v1_dir + "/auth.py", auth_endpoints_content)
 
         # Generate __init__.py that exports the router
         init_content = self._get_init_template()
-        self.write_file(f"{self.config.path}/app/api/v1/__init__.py", init_content)
+        self.write_file(self._api_v1_dir + "/__init__.py", init_content)
 
     def _get_endpoints_template(self) -> str:
         """Get main endpoints template"""
@@ -76,8 +77,8 @@ async def health_check():
                 # MongoDB imports
                 database_imports = "from app.schemas.auth import User"
 
-        return template.format(
-            project_name=self.get_template_vars()["project_name"],
+        return self.format_template(
+            template,
             auth_imports=auth_imports,
             auth_endpoints_include=auth_endpoints_include,
             database_imports=database_imports,
@@ -112,7 +113,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from app.core.config import settings
 from app.db.database import get_db
 from app.schemas.auth import Token, UserLogin, UserCreate, User as UserSchema
-from app.core.security import authenticate_user, create_access_token, get_current_user, create_user
+from app.core.security import authenticate_user, create_access_token, get_current_user, get_user_by_email, create_user
 
 router = APIRouter()
 
@@ -146,7 +147,6 @@ async def register_user(
 ):
     """Register new user"""
     # Check if user already exists
-    from app.core.security import get_user_by_email
     existing_user = {await_keyword}get_user_by_email(db, user_data.email)
     if existing_user:
         raise HTTPException(
@@ -338,8 +338,6 @@ async def verify_api_key(api_key: str = Depends(get_api_key)):
 
     def _get_init_template(self) -> str:
         """Get __init__.py template that exports the router"""
-        from ...core.config import AuthType
-
         if self.config.auth_type != AuthType.NONE:
             template = '''"""
 API v1 Router
@@ -4,67 +4,69 @@ Generates authentication and security files
 """
 
 from ...generators.base_generator import BaseGenerator
-from ...core.config import AuthType
+from ...core.config import AuthType, ProjectConfig, TOKEN_AUTH_TYPES
 
+_JWT_USER_FUNCTIONS = '''
+async def get_user_by_email(db: Session, email: str) -> Optional[User]:
+    """Get user by email"""
+    result = await db.execute(select(User).filter(User.email == email))
+    return result.scalars().first()
 
-class AuthGenerator(BaseGenerator):
-    """Generates authentication files"""
-
-    def should_generate(self) -> bool:
-        """Only generate if authentication is enabled"""
-        return self.config.auth_type != AuthType.NONE
-
-    def generate(self):
-        """Generate authentication files"""
-        # Generate security.py
-        security_content = self._get_security_template()
-        self.write_file(f"{self.config.path}/app/core/security.py", security_content)
 
-        # Generate auth models and schemas only if using SQL database and JWT/OAuth2
-        if (
-            self.config.auth_type in [AuthType.JWT, AuthType.OAUTH2]
-            and self.should_generate_sqlalchemy_files()
-        ):
-            auth_models_content = self._get_auth_models_template()
-            self.write_file(
-                f"{self.config.path}/app/models/auth.py", auth_models_content
-            )
-
-            auth_schemas_content = self._get_auth_schemas_template()
-            self.write_file(
-                f"{self.config.path}/app/schemas/auth.py", auth_schemas_content
-            )
-        elif self.config.auth_type in [AuthType.JWT, AuthType.OAUTH2]:
-            # For NoSQL databases (MongoDB), generate simplified auth schemas
-            auth_schemas_content = self._get_nosql_auth_schemas_template()
-            self.write_file(
-                f"{self.config.path}/app/schemas/auth.py", auth_schemas_content
-            )
+async def create_user(db: Session, email: str, password: str) -> User:
+    """Create new user"""
+    hashed_password = get_password_hash(password)
+    user = User(email=email, hashed_password=hashed_password)
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    return user
+'''
 
-    def _get_security_template(self) -> str:
-        """Get security template based on auth type"""
-        if self.config.auth_type == AuthType.JWT:
-            return self._get_jwt_template()
-        elif self.config.auth_type == AuthType.OAUTH2:
-            return self._get_oauth2_template()
-        elif self.config.auth_type == AuthType.API_KEY:
-            return self._get_api_key_template()
-        return ""
+_JWT_AUTHENTICATE_FUNCTION = '''
+async def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+    """Authenticate user with email and password"""
+    user = await get_user_by_email(db, email)
+    if not user or not verify_password(password, user.hashed_password):
+        return None
+    return user
+'''
 
-    def _get_jwt_template(self) -> str:
-        """Get JWT authentication template"""
+_JWT_CURRENT_USER_FUNCTION = '''
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """Get current authenticated user"""
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    
+    token_data = verify_token(credentials.credentials)
+    if token_data is None:
+        raise credentials_exception
+    
+    user = await get_user_by_email(db, email=token_data.email)
+    if user is None:
+        raise credentials_exception
+    
+    return user
+'''
 
-        # Original SQL-based JWT template
-        template = '''"""
+# The JWT template has no per-project values, so it is assembled once at import
+_JWT_TEMPLATE = '''"""
 JWT Authentication Security
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.db.database import get_db
@@ -92,9 +94,9 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """Create JWT access token"""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update(dict(exp=expire))
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
@@ -120,62 +122,62 @@ def verify_token(token: str) -> Optional[TokenData]:
 
 
 {current_user_function}
-'''
+'''.format(
+    user_functions=_JWT_USER_FUNCTIONS,
+    authenticate_function=_JWT_AUTHENTICATE_FUNCTION,
+    current_user_function=_JWT_CURRENT_USER_FUNCTION,
+)
 
-        user_functions = '''
-async def get_user_by_email(db: Session, email: str) -> Optional[User]:
-    """Get user by email"""
-    from sqlalchemy import select
-    result = await db.execute(select(User).filter(User.email == email))
-    return result.scalars().first()
 
+class AuthGenerator(BaseGenerator):
+    """Generates authentication files"""
 
-async def create_user(db: Session, email: str, password: str) -> User:
-    """Create new user"""
-    hashed_password = get_password_hash(password)
-    user = User(email=email, hashed_password=hashed_password)
-    db.add(user)
-    await db.commit()
-    await db.refresh(user)
-    return user
-'''
+    def __init__(self, config: ProjectConfig):
+        super().__init__(config)
+        # Output paths are fixed per project, build them once
+        app_dir = f"{config.path}/app"
+        self._security_path = f"{app_dir}/core/security.py"
+        self._auth_models_path = f"{app_dir}/models/auth.py"
+        self._auth_schemas_path = f"{app_dir}/schemas/auth.py"
 
-        authenticate_function = '''
-async def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
-    """Authenticate user with email and password"""
-    user = await get_user_by_email(db, email)
-    if not user or not verify_password(password, user.hashed_password):
-        return None
-    return user
-'''
+    def should_generate(self) -> bool:
+        """Only generate if authentication is enabled"""
+        return self.config.auth_type != AuthType.NONE
 
-        current_user_function = '''
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get current authenticated user"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    token_data = verify_token(credentials.credentials)
-    if token_data is None:
-        raise credentials_exception
-    
-    user = await get_user_by_email(db, email=token_data.email)
-    if user is None:
-        raise credentials_exception
-    
-    return user
-'''
-        return template.format(
-            user_functions=user_functions,
-            authenticate_function=authenticate_function,
-            current_user_function=current_user_function,
-        )
+    def generate(self):
+        """Generate authentication files"""
+        # Generate security.py
+        security_content = self._get_security_template()
+        self.write_file(self._security_path, security_content)
+
+        # Generate auth models and schemas only if using SQL database and JWT/OAuth2
+        if (
+            self.config.auth_type in TOKEN_AUTH_TYPES
+            and self.should_generate_sqlalchemy_files()
+        ):
+            auth_models_content = self._get_auth_models_template()
+            self.write_file(self._auth_models_path, auth_models_content)
+
+            auth_schemas_content = self._get_auth_schemas_template()
+            self.write_file(self._auth_schemas_path, auth_schemas_content)
+        elif self.config.auth_type in TOKEN_AUTH_TYPES:
+            # For NoSQL databases (MongoDB), generate simplified auth schemas
+            auth_schemas_content = self._get_nosql_auth_schemas_template()
+            self.write_file(self._auth_schemas_path, auth_schemas_content)
+
+    def _get_security_template(self) -> str:
+        """Get security template based on auth type"""
+        if self.config.auth_type == AuthType.JWT:
+            return self._get_jwt_template()
+        elif self.config.auth_type == AuthType.OAUTH2:
+            return self._get_oauth2_template()
+        elif self.config.auth_type == AuthType.API_KEY:
+            return self._get_api_key_template()
+        return ""
+
+    def _get_jwt_template(self) -> str:
+        """Get JWT authentication template"""
+        return _JWT_TEMPLATE
 
     def _get_oauth2_template(self) -> str:
         """Get OAuth2 authentication template"""
@@ -192,7 +194,7 @@ async def get_current_user(
 OAuth2 Authentication Security with Database
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -226,9 +228,9 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """Create JWT access token"""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(
+        expire = datetime.now(timezone.utc) + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
 
@@ -265,8 +267,8 @@ async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
 
 async def get_user_by_user_id(db: AsyncSession, user_id: int) -> Optional[User]:
     """Get user by user ID"""
-    result = await db.execute(select(User).filter(User.id == user_id))
-    return result.scalars().first()
+    # Primary key lookup, served from the session identity map when already loaded
+    return await db.get(User, user_id)
 
 
 async def create_user(db: AsyncSession, email: str, password: str) -> User:
@@ -328,13 +330,17 @@ async def get_current_active_user(
 OAuth2 Authentication Security (Simple)
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from jose import JWTError, jwt
+from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from app.core.config import settings
 
+# Password hashing
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 # OAuth2 scheme with token URL
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_PREFIX}/auth/token")
 
@@ -351,15 +357,11 @@ fake_users_db = {
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    from passlib.context import CryptContext
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     return pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Generate password hash"""
-    from passlib.context import CryptContext
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     return pwd_context.hash(password)
 
 
@@ -367,9 +369,9 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """Create JWT access token"""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
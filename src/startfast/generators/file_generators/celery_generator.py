@@ -93,7 +93,6 @@ def send_email_task(email: str, subject: str, body: str):
     """
     # Implement your email sending logic here
     print(f"Sending email to {{email}} with subject: {{subject}}")
-    time.sleep(2)  # Simulate email sending delay
     return f"Email sent to {{email}}"
 
 
@@ -104,7 +103,6 @@ def process_data_task(data: dict):
     """
     # Implement your data processing logic here
     print(f"Processing data: {{data}}")
-    time.sleep(5)  # Simulate processing delay
     return {{"status": "success", "processed_data": data}}
 '''
         return template
@@ -1,6 +1,7 @@
 """Config Generator - Generates configuration files"""
 
 from ...generators.base_generator import BaseGenerator
+from ...core.config import AuthType, DatabaseType
 
 
 class ConfigGenerator(BaseGenerator):
@@ -64,13 +65,7 @@ settings = Settings()
 
     def _get_database_settings(self) -> str:
         """Get database-specific settings"""
-        from ...core.config import DatabaseType
-
-        if self.config.database_type in [
-            DatabaseType.SQLITE,
-            DatabaseType.POSTGRESQL,
-            DatabaseType.MYSQL,
-        ]:
+        if self.config.uses_sqlalchemy:
             return """    DATABASE_URL: str
     DATABASE_HOST: Optional[str] = None
     DATABASE_PORT: Optional[int] = None
@@ -87,8 +82,6 @@ settings = Settings()
 
     def _get_security_settings(self) -> str:
         """Get security-specific settings"""
-        from ...core.config import AuthType
-
         if self.config.auth_type == AuthType.JWT:
             return """    SECRET_KEY: str
     ALGORITHM: str = "HS256"
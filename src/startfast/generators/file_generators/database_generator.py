@@ -4,39 +4,10 @@ Generates database configuration and connection files
 """
 
 from ...generators.base_generator import BaseGenerator
-from ...core.config import DatabaseType
+from ...core.config import DatabaseType, ProjectConfig, SQL_DATABASE_TYPES
 
-
-class DatabaseGenerator(BaseGenerator):
-    """Generates database configuration files"""
-
-    def generate(self):
-        """Generate database files"""
-        if self.config.database_type in [
-            DatabaseType.SQLITE,
-            DatabaseType.POSTGRESQL,
-            DatabaseType.MYSQL,
-        ]:
-            self._generate_sqlalchemy_files()
-        elif self.config.database_type == DatabaseType.MONGODB:
-            self._generate_mongodb_files()
-    
-    def _generate_sqlalchemy_files(self):
-        """Generate SQLAlchemy database files"""
-        database_content = self._get_sqlalchemy_template()
-        self.write_file(f"{self.config.path}/app/db/database.py", database_content)
-
-        base_content = self._get_base_model_template()
-        self.write_file(f"{self.config.path}/app/db/base.py", base_content)
-
-    def _generate_mongodb_files(self):
-        """Generate MongoDB database files"""
-        database_content = self._get_mongodb_template()
-        self.write_file(f"{self.config.path}/app/db/database.py", database_content)
-
-    def _get_sqlalchemy_template(self) -> str:
-        """Get SQLAlchemy database template"""
-        template = '''"""
+# Database templates are static ASCII, kept as bytes so writes skip encoding
+_SQLALCHEMY_TEMPLATE = b'''"""
 Async SQLAlchemy Database Configuration
 """
 
@@ -94,11 +65,8 @@ async def drop_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 '''
-        return template
 
-    def _get_base_model_template(self) -> str:
-        """Get base model template"""
-        template = '''"""
+_BASE_MODEL_TEMPLATE = b'''"""
 Base Model Classes
 """
 
@@ -127,11 +95,7 @@ class BaseModel(Base, TimestampMixin):
     id = Column(Integer, primary_key=True, index=True)
 '''
 
-        return template
-
-    def _get_mongodb_template(self) -> str:
-        """Get MongoDB database template"""
-        template = '''"""
+_MONGODB_TEMPLATE = b'''"""
 Async MongoDB Database Configuration
 """
 
@@ -162,4 +126,56 @@ async def get_database():
     """Get database instance"""
     return client.get_default_database()
 '''
-        return template
+
+
+class DatabaseGenerator(BaseGenerator):
+    """Generates database configuration files"""
+
+    # Database type -> method generating its files
+    _FILE_GENERATORS = {
+        **{
+            database_type: "_generate_sqlalchemy_files"
+            for database_type in SQL_DATABASE_TYPES
+        },
+        DatabaseType.MONGODB: "_generate_mongodb_files",
+    }
+
+    def __init__(self, config: ProjectConfig):
+        super().__init__(config)
+        # Every database file lives under app/db, build the prefix once
+        self._db_dir = f"{config.path}/app/db"
+
+    def should_generate(self) -> bool:
+        """Only generate for database types that have files"""
+        return self.config.database_type in self._FILE_GENERATORS
+
+    def generate(self):
+        """Generate database files"""
+        generate_files = self._FILE_GENERATORS.get(self.config.database_type)
+        if generate_files is not None:
+            getattr(self, generate_files)()
+    
+    def _generate_sqlalchemy_files(self):
+        """Generate SQLAlchemy database files"""
+        database_content = self._get_sqlalchemy_template()
+        self.write_file(self._db_dir + "/database.py", database_content)
+
+        base_content = self._get_base_model_template()
+        self.write_file(self._db_dir + "/base.py", base_content)
+
+    def _generate_mongodb_files(self):
+        """Generate MongoDB database files"""
+        database_content = self._get_mongodb_template()
+        self.write_file(self._db_dir + "/database.py", database_content)
+
+    def _get_sqlalchemy_template(self) -> bytes:
+        """Get SQLAlchemy database template"""
+        return _SQLALCHEMY_TEMPLATE
+
+    def _get_base_model_template(self) -> bytes:
+        """Get base model template"""
+        return _BASE_MODEL_TEMPLATE
+
+    def _get_mongodb_template(self) -> bytes:
+        """Get MongoDB database template"""
+        return _MONGODB_TEMPLATE
@@ -1,6 +1,7 @@
 """Docker Generator - Generates Docker configuration"""
 
 from ...generators.base_generator import BaseGenerator
+from ...core.config import DatabaseType
 
 
 class DockerGenerator(BaseGenerator):
@@ -87,14 +88,12 @@ volumes:
 
 networks:
   default:
-    name: {self.config.name.lower().replace("-", "_")}_network
+    name: {self.config.name_snake}_network
 """
         return template
 
     def _get_database_service_depends(self) -> str:
         """Get database service dependencies"""
-        from ...core.config import DatabaseType
-
         if self.config.database_type == DatabaseType.POSTGRESQL:
             return "      - postgres"
         elif self.config.database_type == DatabaseType.MYSQL:
@@ -105,8 +104,6 @@ networks:
 
     def _get_database_services(self) -> str:
         """Get database services"""
-        from ...core.config import DatabaseType
-
         if self.config.database_type == DatabaseType.POSTGRESQL:
             return """  postgres:
     image: postgres:15
@@ -181,8 +178,6 @@ networks:
 
     def _get_volumes(self) -> str:
         """Get Docker volumes"""
-        from ...core.config import DatabaseType
-
         volumes = []
 
         if self.config.database_type == DatabaseType.POSTGRESQL:
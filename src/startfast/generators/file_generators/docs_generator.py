@@ -1,6 +1,7 @@
 """Docs Generator - Generates documentation"""
 
 from ...generators.base_generator import BaseGenerator
+from ...core.config import AuthType
 
 
 class DocsGenerator(BaseGenerator):
@@ -175,8 +176,6 @@ All endpoints return error responses in the following format:
 
     def _get_auth_docs(self) -> str:
         """Get authentication documentation"""
-        from ...core.config import AuthType
-
         if self.config.auth_type == AuthType.NONE:
             return "No authentication required."
         elif self.config.auth_type == AuthType.JWT:
@@ -1,6 +1,7 @@
 """Main App Generator - Generates main FastAPI application"""
 
 from ...generators.base_generator import BaseGenerator
+from ...core.config import AuthType, DatabaseType
 
 
 class MainAppGenerator(BaseGenerator):
@@ -78,13 +79,7 @@ async def health_check():
 
     def _get_database_imports(self) -> str:
         """Get database imports"""
-        from ...core.config import DatabaseType
-
-        if self.config.database_type in [
-            DatabaseType.SQLITE,
-            DatabaseType.POSTGRESQL,
-            DatabaseType.MYSQL,
-        ]:
+        if self.config.uses_sqlalchemy:
             return "from app.db.database import engine"
         elif self.config.database_type == DatabaseType.MONGODB:
             return "from app.db.database import init_db"
@@ -92,8 +87,6 @@ async def health_check():
 
     def _get_auth_imports(self) -> str:
         """Get auth imports"""
-        from ...core.config import AuthType
-
         if self.config.auth_type != AuthType.NONE:
             return "from app.core.security import get_current_user"
         return ""
@@ -177,13 +170,7 @@ async def lifespan(app: FastAPI):
         startup_lines = []
 
         # Add database initialization for SQL databases
-        from ...core.config import DatabaseType
-
-        if self.config.database_type in [
-            DatabaseType.SQLITE,
-            DatabaseType.POSTGRESQL,
-            DatabaseType.MYSQL,
-        ]:
+        if self.config.uses_sqlalchemy:
             startup_lines.append("    from app.db.database import init_db")
             startup_lines.append("    await init_db()")
             startup_lines.append(
@@ -210,13 +197,7 @@ async def lifespan(app: FastAPI):
         shutdown_lines = []
 
         # Add database cleanup for SQL databases
-        from ...core.config import DatabaseType
-
-        if self.config.database_type in [
-            DatabaseType.SQLITE,
-            DatabaseType.POSTGRESQL,
-            DatabaseType.MYSQL,
-        ]:
+        if self.config.uses_sqlalchemy:
             shutdown_lines.append("        from app.db.database import engine")
             shutdown_lines.append("        await engine.dispose()")
             shutdown_lines.append('        logger.info("Database engine disposed")')
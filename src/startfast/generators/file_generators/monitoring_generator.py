@@ -1,34 +1,9 @@
 """Monitoring Generator - Generates monitoring configuration"""
 
+from ...core.config import ProjectConfig
 from ...generators.base_generator import BaseGenerator
 
-
-class MonitoringGenerator(BaseGenerator):
-    """Generates monitoring configuration files"""
-
-    def should_generate(self):
-        return self.config.include_monitoring
-
-    def generate(self):
-        """Generate monitoring files"""
-        if not self.config.include_monitoring:
-            return
-
-        # Generate Prometheus configuration
-        prometheus_content = self._get_prometheus_template()
-        self.write_file(
-            f"{self.config.path}/monitoring/prometheus.yml", prometheus_content
-        )
-
-        # Generate monitoring utilities
-        monitoring_content = self._get_monitoring_template()
-        self.write_file(
-            f"{self.config.path}/app/core/monitoring.py", monitoring_content
-        )
-
-    def _get_prometheus_template(self) -> str:
-        """Get Prometheus configuration template"""
-        template = f"""global:
+_PROMETHEUS_TEMPLATE = """global:
   scrape_interval: 15s
   evaluation_interval: 15s
 
@@ -37,7 +12,7 @@ rule_files:
   # - "second_rules.yml"
 
 scrape_configs:
-  - job_name: '{self.config.name}'
+  - job_name: '{project_name}'
     static_configs:
       - targets: ['web:8000']
     metrics_path: '/metrics'
@@ -47,17 +22,14 @@ scrape_configs:
     static_configs:
       - targets: ['localhost:9090']
 """
-        return template
 
-    def _get_monitoring_template(self) -> str:
-        """Get monitoring utilities template"""
-        template = f'''"""
-Monitoring utilities for {self.config.name}
+_MONITORING_TEMPLATE = '''"""
+Monitoring utilities for {project_name}
 """
 
 import time
 import logging
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Optional, Dict, Any
 from prometheus_client import Counter, Histogram, Gauge, Info
 import structlog
@@ -90,37 +62,64 @@ APPLICATION_INFO = Info(
 
 # Set application info
 APPLICATION_INFO.info({{
-    'name': '{self.config.name}',
+    'name': '{project_name}',
     'version': '1.0.0',
-    'python_version': '{self.config.python_version}'
+    'python_version': '{python_version}'
 }})
 
 
+@lru_cache(maxsize=1024)
+def _request_count(method: str, endpoint: str, status_code: int):
+    """
+    Get the labeled request counter, reusing the child for repeated label sets
+    """
+    return REQUEST_COUNT.labels(method=method, endpoint=endpoint, status_code=status_code)
+
+
+@lru_cache(maxsize=1024)
+def _request_duration(method: str, endpoint: str):
+    """
+    Get the labeled request duration histogram, reusing the child for repeated label sets
+    """
+    return REQUEST_DURATION.labels(method=method, endpoint=endpoint)
+
+
 def monitor_requests(func):
     """
     Decorator to monitor request metrics
     """
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         method = kwargs.get('method', 'GET')
         endpoint = kwargs.get('endpoint', 'unknown')
         
         try:
             result = await func(*args, **kwargs)
             status_code = getattr(result, 'status_code', 200)
-            REQUEST_COUNT.labels(method=method, endpoint=endpoint, status_code=status_code).inc()
+            _request_count(method, endpoint, status_code).inc()
             return result
         except Exception as e:
-            REQUEST_COUNT.labels(method=method, endpoint=endpoint, status_code=500).inc()
+            _request_count(method, endpoint, 500).inc()
             logger.error("Request failed", error=str(e), endpoint=endpoint)
             raise
         finally:
-            REQUEST_DURATION.labels(method=method, endpoint=endpoint).observe(time.time() - start_time)
+            _request_duration(method, endpoint).observe(time.perf_counter() - start_time)
     
     return wrapper
 
 
+def _record_operation(operation: str, start_time: float, error: Optional[Exception] = None):
+    """
+    Log the outcome and duration of a monitored operation
+    """
+    duration = time.perf_counter() - start_time
+    if error is None:
+        logger.info(f"Completed {{operation}}", duration=duration)
+    else:
+        logger.error(f"Failed {{operation}}", error=str(error), duration=duration)
+
+
 def log_performance(operation: str):
     """
     Decorator to log performance metrics
@@ -128,18 +127,16 @@ def log_performance(operation: str):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             logger.info(f"Starting {{operation}}")
             
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
-                logger.info(f"Completed {{operation}}", duration=duration)
-                return result
             except Exception as e:
-                duration = time.time() - start_time
-                logger.error(f"Failed {{operation}}", error=str(e), duration=duration)
+                _record_operation(operation, start_time, e)
                 raise
+            _record_operation(operation, start_time)
+            return result
         
         return wrapper
     return decorator
@@ -191,4 +188,44 @@ async def external_service_health_check():
 health_checker.add_check("database", database_health_check)
 health_checker.add_check("external_services", external_service_health_check)
 '''
-        return template
+
+
+class MonitoringGenerator(BaseGenerator):
+    """Generates monitoring configuration files"""
+
+    def __init__(self, config: ProjectConfig):
+        super().__init__(config)
+        # Output paths are fixed per project, build them once
+        self._prometheus_path = f"{config.path}/monitoring/prometheus.yml"
+        self._monitoring_path = f"{config.path}/app/core/monitoring.py"
+
+    def should_generate(self):
+        return self.config.include_monitoring
+
+    def generate(self):
+        """Generate monitoring files"""
+        if not self.config.include_monitoring:
+            return
+
+        self.write_files(
+            [
+                # Prometheus configuration
+                (
+                    self._prometheus_path,
+                    self._get_prometheus_template(),
+                ),
+                # Monitoring utilities
+                (
+                    self._monitoring_path,
+                    self._get_monitoring_template(),
+                ),
+            ]
+        )
+
+    def _get_prometheus_template(self) -> bytes:
+        """Get Prometheus configuration template"""
+        return self.format_template_bytes(_PROMETHEUS_TEMPLATE)
+
+    def _get_monitoring_template(self) -> bytes:
+        """Get monitoring utilities template"""
+        return self.format_template_bytes(_MONITORING_TEMPLATE)
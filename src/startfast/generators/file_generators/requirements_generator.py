@@ -4,7 +4,7 @@ Generates requirements.txt with appropriate dependencies
 """
 
 from ...generators.base_generator import BaseGenerator
-from ...core.config import DatabaseType, AuthType
+from ...core.config import DatabaseType, AuthType, TOKEN_AUTH_TYPES
 
 
 class RequirementsGenerator(BaseGenerator):
@@ -85,7 +85,7 @@ class RequirementsGenerator(BaseGenerator):
         """Get authentication-specific requirements"""
         requirements = []
 
-        if self.config.auth_type in [AuthType.JWT, AuthType.OAUTH2]:
+        if self.config.auth_type in TOKEN_AUTH_TYPES:
             requirements.extend(
                 [
                     "python-jose[cryptography]>=3.3.0",
@@ -110,6 +110,7 @@ class RequirementsGenerator(BaseGenerator):
                     "pytest-asyncio>=0.21.1",
                     "httpx>=0.25.2",
                     "pytest-cov>=4.1.0",
+                    "pytest-xdist>=3.5.0",
                 ]
             )
 
@@ -1,40 +1,19 @@
 """Schemas Generator - Generates Pydantic schemas"""
 
+from ...core.config import ProjectConfig
 from ...generators.base_generator import BaseGenerator
 
-
-class SchemasGenerator(BaseGenerator):
-    """Generates Pydantic schema files"""
-
-    def generate(self):
-        """Generate schema files"""
-        # Generate base schemas
-        base_schemas_content = self._get_base_schemas_template()
-        self.write_file(
-            f"{self.config.path}/app/schemas/__init__.py", base_schemas_content
-        )  # Generate auth schemas if auth is enabled
-        if self.config.auth_type.value != "none":
-            user_schemas_content = self._get_user_schemas_template()
-            self.write_file(
-                f"{self.config.path}/app/schemas/user.py", user_schemas_content
-            )
-
-            # Also create auth.py that imports from user.py for convenience
-            auth_schemas_content = self._get_auth_schemas_template()
-            self.write_file(
-                f"{self.config.path}/app/schemas/auth.py", auth_schemas_content
-            )
-
-    def _get_base_schemas_template(self) -> str:
-        """Get base schemas template"""
-        template = '''"""
+# Schema templates are static ASCII, kept as bytes so writes skip encoding
+_BASE_SCHEMAS_TEMPLATE = b'''"""
 Base schemas for Pydantic models
 """
 
 from datetime import datetime
-from typing import Optional, List, Any
+from typing import Optional, List, Generic, TypeVar
 from pydantic import BaseModel, Field
 
+ItemT = TypeVar("ItemT")
+
 
 class BaseSchema(BaseModel):
     """Base schema with common fields"""
@@ -61,9 +40,9 @@ class PaginationParams(BaseModel):
     per_page: int = Field(default=10, ge=1, le=100, description="Items per page")
 
 
-class PaginatedResponse(BaseModel):
-    """Paginated response schema"""
-    items: List[Any]
+class PaginatedResponse(BaseModel, Generic[ItemT]):
+    """Paginated response schema, parametrize as PaginatedResponse[Item]"""
+    items: List[ItemT]
     pagination: dict
 
 
@@ -85,11 +64,8 @@ class HealthCheckResponse(BaseModel):
     timestamp: datetime
     details: Optional[dict] = None
 '''
-        return template
 
-    def _get_user_schemas_template(self) -> str:
-        """Get user schemas template"""
-        template = '''"""
+_USER_SCHEMAS_TEMPLATE = b'''"""
 User schemas
 """
 
@@ -146,11 +122,8 @@ class TokenData(BaseModel):
     user_id: Optional[int] = None
     email: Optional[str] = None
 '''
-        return template
 
-    def _get_auth_schemas_template(self) -> str:
-        """Get auth schemas template that imports from user.py for convenience"""
-        template = '''"""
+_AUTH_SCHEMAS_TEMPLATE = b'''"""
 Auth schemas - Convenience imports from user schemas
 """
 
@@ -177,4 +150,56 @@ __all__ = [
     "TokenData"
 ]
 '''
-        return template
+
+
+class SchemasGenerator(BaseGenerator):
+    """Generates Pydantic schema files"""
+
+    def __init__(self, config: ProjectConfig):
+        super().__init__(config)
+        # Output paths are fixed per project, build them once
+        schemas_dir = f"{config.path}/app/schemas"
+        self._base_schemas_path = f"{schemas_dir}/__init__.py"
+        self._user_schemas_path = f"{schemas_dir}/user.py"
+        self._auth_schemas_path = f"{schemas_dir}/auth.py"
+
+    def generate(self):
+        """Generate schema files"""
+        # Base schemas
+        files = [
+            (
+                self._base_schemas_path,
+                self._get_base_schemas_template(),
+            )
+        ]
+
+        # Auth schemas if auth is enabled
+        if self.config.auth_type.value != "none":
+            files.append(
+                (
+                    self._user_schemas_path,
+                    self._get_user_schemas_template(),
+                )
+            )
+
+            # Also create auth.py that imports from user.py for convenience
+            files.append(
+                (
+                    self._auth_schemas_path,
+                    self._get_auth_schemas_template(),
+                )
+            )
+
+        self.write_files(files)
+
+    def _get_base_schemas_template(self) -> bytes:
+        """Get base schemas template"""
+        return _BASE_SCHEMAS_TEMPLATE
+
+    def _get_user_schemas_template(self) -> bytes:
+        """Get user schemas template"""
+        return _USER_SCHEMAS_TEMPLATE
+
+    def _get_auth_schemas_template(self) -> bytes:
+        """Get auth schemas template that imports from user.py for convenience"""
+        return _AUTH_SCHEMAS_TEMPLATE
@@ -1,63 +1,9 @@
 """Tests Generator - Generates test files"""
 
 from ...generators.base_generator import BaseGenerator
+from ...core.config import AuthType, ProjectConfig
 
-
-class TestsGenerator(BaseGenerator):
-    """Generates test files"""
-
-    def should_generate(self):
-        return self.config.include_tests
-
-    def generate(self):
-        """Generate test files"""
-        if not self.config.include_tests:
-            return
-
-        # Generate conftest.py
-        conftest_content = self._get_conftest_template()
-        self.write_file(f"{self.config.path}/tests/conftest.py", conftest_content)
-
-        # Generate test_main.py
-        test_main_content = self._get_test_main_template()
-        self.write_file(f"{self.config.path}/tests/test_main.py", test_main_content)
-
-        # Generate test_api.py
-        test_api_content = self._get_test_api_template()
-        self.write_file(f"{self.config.path}/tests/test_api.py", test_api_content)
-
-        # Generate pytest.ini
-        pytest_ini_content = self._get_pytest_ini_template()
-        self.write_file(f"{self.config.path}/pytest.ini", pytest_ini_content)
-
-    def _get_conftest_template(self) -> str:
-        """Get conftest.py template"""
-        template = '''"""
-Test configuration and fixtures
-"""
-
-import pytest
-from fastapi.testclient import TestClient
-from app.main import app
-
-
-@pytest.fixture
-def client():
-    """Test client fixture"""
-    return TestClient(app)
-
-
-@pytest.fixture
-def auth_headers():
-    """Authentication headers fixture"""
-    # Add authentication logic here if needed
-    return {"Authorization": "Bearer test-token"}
-'''
-        return template
-
-    def _get_test_main_template(self) -> str:
-        """Get test_main.py template"""
-        template = f'''"""
+_TEST_MAIN_TEMPLATE = '''"""
 Tests for main application
 """
 
@@ -71,7 +17,7 @@ def test_root_endpoint(client: TestClient):
     assert response.status_code == 200
     data = response.json()
     assert "message" in data
-    assert data["message"] == "Welcome to {self.config.name}!"
+    assert data["message"] == "Welcome to {project_name}!"
 
 
 def test_health_check(client: TestClient):
@@ -80,7 +26,7 @@ def test_health_check(client: TestClient):
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
-    assert data["service"] == "{self.config.name}"
+    assert data["service"] == "{project_name}"
 
 
 def test_docs_endpoint(client: TestClient):
@@ -96,11 +42,36 @@ def test_openapi_endpoint(client: TestClient):
     data = response.json()
     assert "openapi" in data
 '''
-        return template
 
-    def _get_test_api_template(self) -> str:
-        """Get test_api.py template"""
-        template = '''"""
+# Static test templates are ASCII, kept as bytes so writes skip encoding
+_CONFTEST_TEMPLATE = b'''"""
+Test configuration and fixtures
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client fixture, shared across the test session"""
+    return TestClient(app)
+'''
+
+# Only emitted for projects with authentication
+_AUTH_FIXTURES_TEMPLATE = b'''
+
+@pytest.fixture
+def auth_headers():
+    """Authentication headers fixture"""
+    # Add authentication logic here if needed
+    return {"Authorization": "Bearer test-token"}
+'''
+
+_AUTH_CONFTEST_TEMPLATE = _CONFTEST_TEMPLATE + _AUTH_FIXTURES_TEMPLATE
+
+_TEST_API_TEMPLATE = b'''"""
 Tests for API endpoints
 """
 
@@ -117,12 +88,10 @@ def test_api_v1_base(client: TestClient):
 
 # Add more API tests here based on your specific endpoints
 '''
-        return template
 
-    def _get_pytest_ini_template(self) -> str:
-        """Get pytest.ini template"""
-        template = f"""[tool:pytest]
+_PYTEST_INI_TEMPLATE = b"""[pytest]
 minversion = 6.0
+# Run the suite across all CPU cores with: pytest -n auto --dist=loadfile
 addopts = -ra -q --strict-markers
 testpaths = tests
 python_files = test_*.py
@@ -133,4 +102,64 @@ markers =
     integration: marks tests as integration tests
     unit: marks tests as unit tests
 """
-        return template
+
+
+class TestsGenerator(BaseGenerator):
+    """Generates test files"""
+
+    def __init__(self, config: ProjectConfig):
+        super().__init__(config)
+        # Output paths are fixed per project, build them once
+        tests_dir = f"{config.path}/tests"
+        self._conftest_path = f"{tests_dir}/conftest.py"
+        self._test_main_path = f"{tests_dir}/test_main.py"
+        self._test_api_path = f"{tests_dir}/test_api.py"
+        self._pytest_ini_path = f"{config.path}/pytest.ini"
+
+    def should_generate(self):
+        return self.config.include_tests
+
+    def generate(self):
+        """Generate test files"""
+        if not self.config.include_tests:
+            return
+
+        self.write_files(
+            [
+                # conftest.py
+                (
+                    self._conftest_path,
+                    self._get_conftest_template(),
+                ),
+                # test_main.py
+                (
+                    self._test_main_path,
+                    self._get_test_main_template(),
+                ),
+                # test_api.py
+                (
+                    self._test_api_path,
+                    self._get_test_api_template(),
+                ),
+                # pytest.ini
+                (self._pytest_ini_path, self._get_pytest_ini_template()),
+            ]
+        )
+
+    def _get_conftest_template(self) -> bytes:
+        """Get conftest.py template"""
+        if self.config.auth_type == AuthType.NONE:
+            return _CONFTEST_TEMPLATE
+        return _AUTH_CONFTEST_TEMPLATE
+
+    def _get_test_main_template(self) -> str:
+        """Get test_main.py template"""
+        return self.format_template(_TEST_MAIN_TEMPLATE)
+
+    def _get_test_api_template(self) -> bytes:
+        """Get test_api.py template"""
+        return _TEST_API_TEMPLATE
+
+    def _get_pytest_ini_template(self) -> bytes:
+        """Get pytest.ini template"""
+        return _PYTEST_INI_TEMPLATE
@@ -1,39 +1,51 @@
 """Utils Generator - Generates utility functions"""
 
 from ...generators.base_generator import BaseGenerator
+from ...core.config import ProjectConfig
 
+_SQL_PAGINATION_IMPORTS = """
+from sqlalchemy import func, select"""
 
-class UtilsGenerator(BaseGenerator):
-    """Generates utility files"""
+_SQL_PAGINATION_HELPER = '''
 
-    def generate(self):
-        """Generate utility files"""
-        # Generate common utilities
-        utils_content = self._get_utils_template()
-        self.write_file(f"{self.config.path}/app/utils/common.py", utils_content)
-
-        # Generate response utilities
-        response_content = self._get_response_template()
-        self.write_file(f"{self.config.path}/app/utils/responses.py", response_content)
-
-        # Generate validation utilities
-        validation_content = self._get_validation_template()
-        self.write_file(
-            f"{self.config.path}/app/utils/validation.py", validation_content
+async def fetch_page_with_total(db, statement, page: int = 1, per_page: int = 10):
+    """Fetch one page of rows and the total row count
+
+    ``statement`` must select a single entity or column, only the first column
+    of each row is returned. The count comes from a COUNT(*) OVER () window
+    column, which needs window function support (SQLite 3.25+, MySQL 8.0+,
+    PostgreSQL), so a non-empty page and its total share one round trip. A
+    page past the end has no row to carry the count, so the total then comes
+    from a separate COUNT query.
+    """
+    offset = (page - 1) * per_page
+    result = await db.execute(
+        statement.add_columns(func.count().over().label("total_count"))
+        .offset(offset)
+        .limit(per_page)
+    )
+    rows = result.all()
+    if rows:
+        total = rows[0].total_count
+    elif offset > 0:
+        total = await db.scalar(
+            select(func.count()).select_from(statement.order_by(None).subquery())
         )
+    else:
+        total = 0
+    return [row[0] for row in rows], total
+'''
 
-    def _get_utils_template(self) -> str:
-        """Get common utilities template"""
-        template = f'''"""
-Common utilities for {self.config.name}
+_COMMON_UTILS_TEMPLATE = '''"""
+Common utilities for {project_name}
 """
 
 import hashlib
 import secrets
 import string
 from datetime import datetime, timezone
-from typing import Optional, Any, Dict
-from pathlib import Path
+from typing import Optional, Any, Dict, Union
+from pathlib import Path{sql_pagination_imports}
 
 
 def generate_random_string(length: int = 32) -> str:
@@ -42,14 +54,24 @@ def generate_random_string(length: int = 32) -> str:
     return ''.join(secrets.choice(alphabet) for _ in range(length))
 
 
-def generate_hash(data: str, algorithm: str = "sha256") -> str:
-    """Generate hash for given data"""
-    if algorithm == "sha256":
-        return hashlib.sha256(data.encode()).hexdigest()
-    elif algorithm == "md5":
-        return hashlib.md5(data.encode()).hexdigest()
-    else:
+_HASH_CONSTRUCTORS = {{
+    "sha256": hashlib.sha256,
+    "md5": hashlib.md5,
+    "blake2b": hashlib.blake2b,
+}}
+
+
+def generate_hash(data: Union[str, bytes], algorithm: str = "sha256") -> str:
+    """Generate hash for given data, bytes are hashed without re-encoding
+
+    blake2b is typically faster than sha256 on 64-bit CPUs without SHA extensions.
+    """
+    constructor = _HASH_CONSTRUCTORS.get(algorithm)
+    if constructor is None:
         raise ValueError(f"Unsupported algorithm: {{algorithm}}")
+    if isinstance(data, str):
+        data = data.encode()
+    return constructor(data).hexdigest()
 
 
 def get_current_timestamp() -> datetime:
@@ -86,7 +108,7 @@ def paginate_query(query, page: int = 1, per_page: int = 10):
     """Paginate query results"""
     offset = (page - 1) * per_page
     return query.offset(offset).limit(per_page)
-
+{sql_pagination_helper}
 
 def calculate_pagination_info(total: int, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
     """Calculate pagination information"""
@@ -105,11 +127,10 @@ def calculate_pagination_info(total: int, page: int = 1, per_page: int = 10) ->
         "next_page": page + 1 if has_next else None,
     }}
 '''
-        return template
 
-    def _get_response_template(self) -> str:
-        """Get response utilities template"""
-        template = '''"""
+# Response and validation templates are static ASCII, kept as bytes so
+# writes skip encoding
+_RESPONSE_TEMPLATE = b'''"""
 Response utilities
 """
 
@@ -194,11 +215,8 @@ def validation_error_response(errors: Dict[str, Any]) -> JSONResponse:
         status_code=422
     )
 '''
-        return template
 
-    def _get_validation_template(self) -> str:
-        """Get validation utilities template"""
-        template = '''"""
+_VALIDATION_TEMPLATE = b'''"""
 Validation utilities
 """
 
@@ -206,6 +224,13 @@ import re
 from typing import Optional, Any, Dict, List
 from email_validator import validate_email, EmailNotValidError
 
+# Patterns are compiled once at import instead of looked up on every call
+_PHONE_SEPARATORS_RE = re.compile(r'[+\\s\\(\\)-]')
+_PW_UPPER_RE = re.compile(r'[A-Z]')
+_PW_LOWER_RE = re.compile(r'[a-z]')
+_PW_DIGIT_RE = re.compile(r'\\d')
+_PW_SPECIAL_RE = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+
 
 def is_valid_email(email: str) -> bool:
     """Validate email address"""
@@ -218,7 +243,7 @@ def is_valid_email(email: str) -> bool:
 
 def is_valid_phone(phone: str) -> bool:
     """Validate phone number (basic validation)"""    # Remove common separators
-    clean_phone = re.sub(r'[+\s\(\)-]', '', phone)
+    clean_phone = _PHONE_SEPARATORS_RE.sub('', phone)
     
     # Check if it contains only digits and is reasonable length
     return clean_phone.isdigit() and 7 <= len(clean_phone) <= 15
@@ -234,16 +259,16 @@ def is_valid_password(password: str, min_length: int = 8) -> Dict[str, Any]:
     if len(password) < min_length:
         errors.append(f"Password must be at least {min_length} characters long")
     
-    if not re.search(r'[A-Z]', password):
+    if not _PW_UPPER_RE.search(password):
         errors.append("Password must contain at least one uppercase letter")
     
-    if not re.search(r'[a-z]', password):
+    if not _PW_LOWER_RE.search(password):
         errors.append("Password must contain at least one lowercase letter")
     
-    if not re.search(r'\\d', password):
+    if not _PW_DIGIT_RE.search(password):
         errors.append("Password must contain at least one digit")
     
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if not _PW_SPECIAL_RE.search(password):
         errors.append("Password must contain at least one special character")
     
     return {
@@ -293,4 +318,56 @@ def validate_file_size(file_size: int, max_size_mb: int = 10) -> bool:
     max_size_bytes = max_size_mb * 1024 * 1024
     return file_size <= max_size_bytes
 '''
-        return template
+
+
+class UtilsGenerator(BaseGenerator):
+    """Generates utility files"""
+
+    def __init__(self, config: ProjectConfig):
+        super().__init__(config)
+        # Output paths are fixed per project, build them once
+        utils_dir = f"{config.path}/app/utils"
+        self._common_path = f"{utils_dir}/common.py"
+        self._responses_path = f"{utils_dir}/responses.py"
+        self._validation_path = f"{utils_dir}/validation.py"
+
+    def generate(self):
+        """Generate utility files"""
+        self.write_files(
+            [
+                # Common utilities
+                (self._common_path, self._get_utils_template()),
+                # Response utilities
+                (self._responses_path, self._get_response_template()),
+                # Validation utilities
+                (self._validation_path, self._get_validation_template()),
+            ]
+        )
+
+    def _get_utils_template(self) -> str:
+        """Get common utilities template"""
+        return self.format_template(
+            _COMMON_UTILS_TEMPLATE,
+            sql_pagination_imports=self._get_sql_pagination_imports(),
+            sql_pagination_helper=self._get_sql_pagination_helper(),
+        )
+
+    def _get_sql_pagination_imports(self) -> str:
+        """Get the module-level imports the SQL pagination helper needs"""
+        if self.should_generate_sqlalchemy_files():
+            return _SQL_PAGINATION_IMPORTS
+        return ""
+
+    def _get_sql_pagination_helper(self) -> str:
+        """Get the single-query pagination helper for SQL databases"""
+        if self.should_generate_sqlalchemy_files():
+            return _SQL_PAGINATION_HELPER
+        return ""
+
+    def _get_response_template(self) -> bytes:
+        """Get response utilities template"""
+        return _RESPONSE_TEMPLATE
+
+    def _get_validation_template(self) -> bytes:
+        """Get validation utilities template"""
+        return _VALIDATION_TEMPLATE
@@ -5,7 +5,10 @@ Orchestrates the creation of FastAPI projects
 
 import os
 import shutil
-from typing import Dict, Any, List
+import threading
+import uuid
+from functools import cached_property
+from typing import Dict, Any, Optional
 from pathlib import Path
 import logging
 
@@ -14,16 +17,50 @@ from ..core.config import ProjectConfig
 
 logger = logging.getLogger(__name__)
 
+# Deepest project directories; makedirs creates app/ and app/api/ on the way
+_LEAF_DIRECTORIES = (
+    "app/api/v1",
+    "app/core",
+    "app/db",
+    "app/models",
+    "app/schemas",
+    "app/services",
+    "app/utils",
+    "tests",
+    "docs",
+)
+
+_INIT_FILES = (
+    "app/__init__.py",
+    "app/api/__init__.py",
+    "app/api/v1/__init__.py",
+    "app/core/__init__.py",
+    "app/db/__init__.py",
+    "app/models/__init__.py",
+    "app/schemas/__init__.py",
+    "app/services/__init__.py",
+    "app/utils/__init__.py",
+    "tests/__init__.py",
+)
+
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
 
 class ProjectGenerator(BaseGenerator):
     """Main project generator that orchestrates the entire project creation"""
 
     def __init__(self, config: ProjectConfig):
         super().__init__(config)
-        self._setup_generators()
+        # Removes a previous project directory while the new one is generated
+        self._cleanup_thread: Optional[threading.Thread] = None
+
+    @cached_property
+    def generators(self) -> Dict[str, BaseGenerator]:
+        """File generators, created on first use"""
+        return self._setup_generators()
 
-    def _setup_generators(self):
-        """Initialize all file generators"""
+    def _setup_generators(self) -> Dict[str, BaseGenerator]:
+        """Initialize the file generators that apply to this configuration"""
         # Import generators here to avoid circular imports
         from .file_generators.requirements_generator import RequirementsGenerator
         from .file_generators.environment_generator import EnvironmentGenerator
@@ -34,11 +71,8 @@ class ProjectGenerator(BaseGenerator):
         from .file_generators.api_generator import APIGenerator
         from .file_generators.schemas_generator import SchemasGenerator
         from .file_generators.utils_generator import UtilsGenerator
-        from .file_generators.docker_generator import DockerGenerator
-        from .file_generators.tests_generator import TestsGenerator
-        from .file_generators.docs_generator import DocsGenerator
 
-        self.generators = {
+        generators = {
             "requirements": RequirementsGenerator(self.config),
             "environment": EnvironmentGenerator(self.config),
             "main": MainAppGenerator(self.config),
@@ -48,30 +82,53 @@ class ProjectGenerator(BaseGenerator):
             "api": APIGenerator(self.config),
             "schemas": SchemasGenerator(self.config),
             "utils": UtilsGenerator(self.config),
-            "docker": DockerGenerator(self.config),
-            "tests": TestsGenerator(self.config),
-            "docs": DocsGenerator(self.config),
         }
 
+        # Optional generators are only imported when their feature is enabled
+        if self.config.include_docker:
+            from .file_generators.docker_generator import DockerGenerator
+
+            generators["docker"] = DockerGenerator(self.config)
+
+        if self.config.include_tests:
+            from .file_generators.tests_generator import TestsGenerator
+
+            generators["tests"] = TestsGenerator(self.config)
+
+        if self.config.include_docs:
+            from .file_generators.docs_generator import DocsGenerator
+
+            generators["docs"] = DocsGenerator(self.config)
+
         if self.config.include_monitoring:
             from .file_generators.monitoring_generator import MonitoringGenerator
 
-            self.generators["monitoring"] = MonitoringGenerator(self.config)
+            generators["monitoring"] = MonitoringGenerator(self.config)
 
         if self.config.include_celery:
             from .file_generators.celery_generator import CeleryGenerator
 
-            self.generators["celery"] = CeleryGenerator(self.config)
+            generators["celery"] = CeleryGenerator(self.config)
+
+        return {
+            name: generator
+            for name, generator in generators.items()
+            if generator.should_generate()
+        }
 
     def generate(self):
         """Generate the complete project"""
-        logger.info(f"Generating FastAPI project: {self.config.name}")
+        logger.info("Generating FastAPI project: %s", self.config.name)
 
-        # Create project directory
-        self._create_project_structure()
+        try:
+            # Create project directory
+            self._create_project_structure()
 
-        # Generate all files
-        self._generate_files()
+            # Generate all files, flushed together so each directory is created once
+            with self.batched_writes():
+                self._generate_files()
+        finally:
+            self._wait_for_cleanup()
 
         logger.info("Project generation completed successfully!")
 
@@ -79,55 +136,67 @@ class ProjectGenerator(BaseGenerator):
         """Create the basic project directory structure"""
         project_path = Path(self.config.path)
 
-        # Remove existing directory if it exists
-        if project_path.exists():
-            shutil.rmtree(project_path)
-
-        # Create main project directories
-        directories = [
-            "app",
-            "app/api",
-            "app/api/v1",
-            "app/core",
-            "app/db",
-            "app/models",
-            "app/schemas",
-            "app/services",
-            "app/utils",
-            "tests",
-            "docs",
-        ]
-
-        for directory in directories:
-            (project_path / directory).mkdir(parents=True, exist_ok=True)
-
-        # Create __init__.py files
-        init_files = [
-            "app/__init__.py",
-            "app/api/__init__.py",
-            "app/api/v1/__init__.py",
-            "app/core/__init__.py",
-            "app/db/__init__.py",
-            "app/models/__init__.py",
-            "app/schemas/__init__.py",
-            "app/services/__init__.py",
-            "app/utils/__init__.py",
-            "tests/__init__.py",
-        ]
-
-        for init_file in init_files:
-            (project_path / init_file).touch()
+        # Move any existing directory aside and delete it while files are generated
+        self._remove_in_background(project_path)
+
+        # Directories remembered from a previous run went with the old tree
+        self.reset_directory_cache()
+        for generator in self.generators.values():
+            generator.reset_directory_cache()
+
+        # Create main project directories, parents come along with each leaf
+        # and are remembered so the project batch does not recreate them
+        for directory in _LEAF_DIRECTORIES:
+            self.ensure_directory(project_path / directory)
+
+        # Create empty __init__.py files, skipping the utime() that touch() does
+        for init_file in _INIT_FILES:
+            os.close(os.open(project_path / init_file, _CREATE_FLAGS, 0o666))
+
+    def _remove_in_background(self, path: Path):
+        """Rename a directory out of the way and delete it on a worker thread"""
+        if path.is_symlink() or not path.is_dir():
+            if os.path.lexists(path):
+                # Not a real directory, rmtree raises just as it did before
+                shutil.rmtree(path)
+            return
+        old_path = path.with_name(f"{path.name}.old.{uuid.uuid4().hex}")
+        try:
+            path.rename(old_path)
+        except OSError:
+            # Renaming can fail (e.g. the directory is in use), delete in place
+            shutil.rmtree(path)
+            return
+        self._cleanup_thread = threading.Thread(
+            target=self._delete_tree, args=(old_path,)
+        )
+        self._cleanup_thread.start()
+
+    @staticmethod
+    def _delete_tree(path: Path):
+        """Delete a moved-aside project tree, reporting anything left behind"""
+        try:
+            shutil.rmtree(path)
+        except OSError as e:
+            logger.warning("Could not remove old project directory %s: %s", path, e)
+
+    def _wait_for_cleanup(self):
+        """Wait for a background directory removal to finish"""
+        if self._cleanup_thread is not None:
+            self._cleanup_thread.join()
+            self._cleanup_thread = None
 
     def _generate_files(self):
         """Generate all project files using the configured generators"""
         for name, generator in self.generators.items():
-            if generator.should_generate():
-                logger.info(f"Generating {name} files...")
-                try:
+            logger.info("Generating %s files...", name)
+            try:
+                # Queue into the project batch when one is open
+                with generator.batched_writes(owner=self):
                     generator.generate()
-                except Exception as e:
-                    logger.error(f"Failed to generate {name} files: {e}")
-                    raise
+            except Exception as e:
+                logger.error("Failed to generate %s files: %s", name, e)
+                raise
 
     def get_generation_summary(self) -> Dict[str, Any]:
         """Get a summary of what was generated"""
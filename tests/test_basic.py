@@ -1,5 +1,6 @@
 """Test configuration and CLI functionality"""
 
+import asyncio
 import pytest
 import tempfile
 import shutil
@@ -11,7 +12,9 @@ from src.startfast.core.config import (
     DatabaseType,
     AuthType,
 )
+from src.startfast.generators.base_generator import BaseGenerator, CompiledTemplate
 from src.startfast.generators.project_generator import ProjectGenerator
+from src.startfast.generators.file_generators.utils_generator import UtilsGenerator
 
 
 class TestProjectConfig:
@@ -45,6 +48,171 @@ class TestProjectConfig:
                 auth_type=AuthType.JWT,
             )
 
+    def test_project_name_forms(self):
+        """Test derived snake and pascal case project names"""
+        config = ProjectConfig(
+            name="My-test_project",
+            path="/tmp/test-project",
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+        )
+
+        assert config.name_snake == "my_test_project"
+        assert config.name_pascal == "MyTestProject"
+
+
+    def test_project_name_forms_follow_renames(self):
+        """Test derived names are recomputed when the project name changes"""
+        config = ProjectConfig(
+            name="first-project",
+            path="/tmp/test-project",
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+        )
+        assert config.name_snake == "first_project"
+
+        config.name = "second-project"
+
+        assert config.name_snake == "second_project"
+        assert config.name_pascal == "SecondProject"
+
+    def test_uses_sqlalchemy_follows_database_changes(self):
+        """Test the SQL check is recomputed when the database type changes"""
+        config = ProjectConfig(
+            name="test-project",
+            path="/tmp/test-project",
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+        )
+        assert config.uses_sqlalchemy
+
+        config.database_type = DatabaseType.MONGODB
+
+        assert not config.uses_sqlalchemy
+
+class TestCompiledTemplate:
+    """Test CompiledTemplate rendering"""
+
+    def test_render_matches_str_format(self):
+        """Test rendering matches str.format, including escaped braces"""
+        raw = "name: {name}\ndata = {{'v': '{version}'}}\n{name}"
+        template = CompiledTemplate(raw)
+
+        assert template.render(name="demo", version="3.11") == raw.format(
+            name="demo", version="3.11"
+        )
+
+    def test_render_bytes_matches_encoded_render(self):
+        """Test byte rendering matches the UTF-8 encoded text rendering"""
+        template = CompiledTemplate("café {name} {{ok}}")
+
+        assert template.render_bytes_map({"name": "naïve"}) == (
+            template.render(name="naïve").encode("utf-8")
+        )
+
+    def test_rejects_format_specs(self):
+        """Test fields with format specs are rejected"""
+        with pytest.raises(ValueError):
+            CompiledTemplate("{value:>10}")
+
+    def test_static_template_renders_without_values(self):
+        """Test a template with only escaped braces needs no values"""
+        template = CompiledTemplate("data = {{'key': 'value'}}")
+
+        assert not template.needs_format
+        assert template.render() == "data = {'key': 'value'}"
+
+    def test_compiled_templates_are_shared(self):
+        """Test the same template text compiles to one shared instance"""
+        template = "project: {project_name}"
+
+        assert BaseGenerator.compile_template(template) is (
+            BaseGenerator.compile_template(template)
+        )
+
+
+class TestUtilsGenerator:
+    """Test UtilsGenerator templates"""
+
+    def test_sql_pagination_helper_renders(self):
+        """Test the SQL pagination helper compiles and imports at module level"""
+        config = ProjectConfig(
+            name="test-project",
+            path="/tmp/test-project",
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+        )
+
+        content = UtilsGenerator(config)._get_utils_template()
+        compile(content, "common.py", "exec")
+        header, helper = content.split("async def fetch_page_with_total", 1)
+        assert "from sqlalchemy import func, select" in header
+        assert "import" not in helper.split("\ndef ", 1)[0]
+        assert "select(func.count())" in helper
+
+    def test_sql_pagination_helper_pages(self):
+        """Test the rendered pagination helper against in-memory SQLite"""
+        pytest.importorskip("sqlalchemy")
+        pytest.importorskip("aiosqlite")
+        pytest.importorskip("greenlet")
+        from sqlalchemy import Column, Integer, MetaData, Table, insert, select
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+        config = ProjectConfig(
+            name="test-project",
+            path="/tmp/test-project",
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+        )
+        namespace = {}
+        content = UtilsGenerator(config)._get_utils_template()
+        exec(compile(content, "common.py", "exec"), namespace)
+        fetch_page_with_total = namespace["fetch_page_with_total"]
+
+        metadata = MetaData()
+        items = Table("items", metadata, Column("id", Integer, primary_key=True))
+        statement = select(items.c.id).order_by(items.c.id)
+
+        async def fetch_pages():
+            engine = create_async_engine("sqlite+aiosqlite://")
+            async with engine.begin() as conn:
+                await conn.run_sync(metadata.create_all)
+            async with AsyncSession(engine) as db:
+                empty = await fetch_page_with_total(db, statement, page=1, per_page=2)
+                await db.execute(insert(items), [{"id": i} for i in range(1, 6)])
+                pages = [
+                    await fetch_page_with_total(db, statement, page=page, per_page=2)
+                    for page in (1, 3, 4)
+                ]
+            await engine.dispose()
+            return empty, pages
+
+        empty, (first, last, past_end) = asyncio.run(fetch_pages())
+
+        assert empty == ([], 0)
+        assert first == ([1, 2], 5)
+        assert last == ([5], 5)
+        assert past_end == ([], 5)
+
+    def test_pagination_helper_skipped_without_sql(self):
+        """Test non-SQL projects get neither the helper nor its imports"""
+        config = ProjectConfig(
+            name="test-project",
+            path="/tmp/test-project",
+            project_type=ProjectType.API,
+            database_type=DatabaseType.MONGODB,
+            auth_type=AuthType.JWT,
+        )
+
+        content = UtilsGenerator(config)._get_utils_template()
+        assert "sqlalchemy" not in content
+        assert "fetch_page_with_total" not in content
+
 
 class TestProjectGenerator:
     """Test ProjectGenerator class"""
@@ -93,6 +261,157 @@ class TestProjectGenerator:
         assert (self.project_path / "tests").exists()
         assert (self.project_path / "docs").exists()
 
+    def test_generate_twice_with_same_generator(self):
+        """Test a second generate() call recreates the project it replaced"""
+        config = ProjectConfig(
+            name="test-project",
+            path=str(self.project_path),
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+        )
+
+        generator = ProjectGenerator(config)
+        generator.generate()
+        generator.generate()
+
+        assert (self.project_path / "app" / "__init__.py").exists()
+        assert (self.project_path / "app" / "main.py").exists()
+
+    def test_regenerate_over_existing_project(self):
+        """Test regenerating replaces the old project and leaves no sibling behind"""
+        config = ProjectConfig(
+            name="test-project",
+            path=str(self.project_path),
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+        )
+
+        ProjectGenerator(config).generate()
+        stale = self.project_path / "stale.txt"
+        stale.write_text("old\n")
+        ProjectGenerator(config).generate()
+
+        assert not stale.exists()
+        assert (self.project_path / "app" / "main.py").exists()
+        assert sorted(p.name for p in Path(self.temp_dir).iterdir()) == [
+            "test-project"
+        ]
+
+    def test_generate_over_file_raises(self):
+        """Test a regular file at the project path is not silently replaced"""
+        config = ProjectConfig(
+            name="test-project",
+            path=str(self.project_path),
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+        )
+        self.project_path.write_text("not a project\n")
+
+        with pytest.raises(OSError):
+            ProjectGenerator(config).generate()
+
+        assert self.project_path.read_text() == "not a project\n"
+
+    def test_write_file_creates_parent_directories(self):
+        """Test write_file creates missing directories and writes UTF-8 content"""
+        config = ProjectConfig(
+            name="test-project",
+            path=str(self.project_path),
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+        )
+
+        generator = ProjectGenerator(config)
+        target = self.project_path / "nested" / "dir" / "file.txt"
+        generator.write_file(str(target), "héllo\n")
+
+        assert target.read_bytes() == "héllo\n".encode("utf-8")
+
+    def test_write_files_writes_every_file(self):
+        """Test write_files writes a batch of files across directories"""
+        config = ProjectConfig(
+            name="test-project",
+            path=str(self.project_path),
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+        )
+
+        generator = ProjectGenerator(config)
+        files = [
+            (str(self.project_path / "a" / f"file{i}.txt"), f"content {i}\n")
+            for i in range(3)
+        ]
+        files.append((str(self.project_path / "b" / "other.txt"), "other\n"))
+        generator.write_files(files)
+
+        for file_path, content in files:
+            assert Path(file_path).read_text() == content
+
+    def test_write_files_without_parallel_io(self):
+        """Test write_files writes sequentially when parallel I/O is disabled"""
+        config = ProjectConfig(
+            name="test-project",
+            path=str(self.project_path),
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+            parallel_io=False,
+        )
+
+        generator = ProjectGenerator(config)
+        files = [
+            (str(self.project_path / f"file{i}.txt"), f"content {i}\n")
+            for i in range(3)
+        ]
+        generator.write_files(files)
+
+        for file_path, content in files:
+            assert Path(file_path).read_text() == content
+
+    def test_batched_writes_flush_on_exit(self):
+        """Test batched writes are deferred until the block exits, last write wins"""
+        config = ProjectConfig(
+            name="test-project",
+            path=str(self.project_path),
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+        )
+
+        generator = ProjectGenerator(config)
+        target = self.project_path / "batched" / "file.txt"
+        with generator.batched_writes():
+            generator.write_file(str(target), "first\n")
+            generator.write_files([(str(target), "second\n")])
+            assert not target.exists()
+
+        assert target.read_text() == "second\n"
+
+    def test_batched_writes_join_owner_batch(self):
+        """Test writes from a sub-generator are flushed with the owner's batch"""
+        config = ProjectConfig(
+            name="test-project",
+            path=str(self.project_path),
+            project_type=ProjectType.API,
+            database_type=DatabaseType.SQLITE,
+            auth_type=AuthType.JWT,
+        )
+
+        generator = ProjectGenerator(config)
+        sub_generator = generator.generators["requirements"]
+        target = self.project_path / "batched" / "file.txt"
+        with generator.batched_writes():
+            with sub_generator.batched_writes(owner=generator):
+                sub_generator.write_file(str(target), "queued\n")
+            assert not target.exists()
+
+        assert target.read_text() == "queued\n"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])